@@ -23,6 +23,9 @@ from app.core.config import settings
 sqlalchemy_url = settings.DATABASE_URL
 if sqlalchemy_url.startswith("postgres://"):
     sqlalchemy_url = sqlalchemy_url.replace("postgres://", "postgresql://", 1)
+# Migrations run on the psycopg3 driver, matching app.database
+if sqlalchemy_url.startswith("postgresql://"):
+    sqlalchemy_url = sqlalchemy_url.replace("postgresql://", "postgresql+psycopg://", 1)
 config.set_main_option("sqlalchemy.url", sqlalchemy_url)
 
 # Interpret the config file for Python logging.
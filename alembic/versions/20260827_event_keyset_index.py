@@ -0,0 +1,30 @@
+"""Add composite index for trigger event keyset pagination
+
+Revision ID: a7c31f9e2b40
+Revises: e51f5c4d8f2a
+Create Date: 2026-08-27
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7c31f9e2b40"
+down_revision = "e51f5c4d8f2a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_trigger_events_created_at_id",
+        "trigger_events",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_trigger_events_created_at_id", table_name="trigger_events")
@@ -0,0 +1,45 @@
+"""Add partial and covering indexes for filtered event queries
+
+Revision ID: c93d08a1e574
+Revises: a7c31f9e2b40
+Create Date: 2026-08-27
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c93d08a1e574"
+down_revision = "a7c31f9e2b40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial index for the common "unprocessed events" listing; much
+    # smaller than a full index because processed rows drop out of it
+    op.create_index(
+        "idx_event_unprocessed",
+        "trigger_events",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("processed = false"),
+        sqlite_where=sa.text("processed = 0"),
+    )
+
+    # Covering index for per-trigger event listings; INCLUDE lets the
+    # keyset pagination query run as an index-only scan on PostgreSQL
+    op.create_index(
+        "idx_event_trigger_created",
+        "trigger_events",
+        ["trigger_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_include=["change_type", "processed"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_event_trigger_created", table_name="trigger_events")
+    op.drop_index("idx_event_unprocessed", table_name="trigger_events")
@@ -0,0 +1,56 @@
+"""Convert JSON columns to JSONB and index filter conditions
+
+Revision ID: b4e6d97c0a12
+Revises: f18b52c6a903
+Create Date: 2026-08-27
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b4e6d97c0a12"
+down_revision = "f18b52c6a903"
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = [
+    ("triggers", "change_types"),
+    ("triggers", "filter_condition"),
+    ("trigger_events", "old_data"),
+    ("trigger_events", "new_data"),
+]
+
+
+def upgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    # GIN index so containment matching on filter conditions can run
+    # in the database if needed
+    op.create_index(
+        "ix_triggers_filter_condition",
+        "triggers",
+        ["filter_condition"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_triggers_filter_condition", table_name="triggers")
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,35 @@
+"""Fill created_at/updated_at with server-side defaults
+
+Revision ID: f92c57a1d8b4
+Revises: e83b19d6f4c7
+Create Date: 2026-08-27
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f92c57a1d8b4"
+down_revision = "e83b19d6f4c7"
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = [
+    ("triggers", "created_at"),
+    ("triggers", "updated_at"),
+    ("trigger_events", "created_at"),
+]
+
+
+def upgrade() -> None:
+    # The database stamps new rows itself; the Python-side per-row
+    # datetime.now() defaults are gone from the models
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
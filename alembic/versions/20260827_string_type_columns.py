@@ -0,0 +1,57 @@
+"""Replace native enum columns with plain strings
+
+Revision ID: e83b19d6f4c7
+Revises: d27a4f83c1e9
+Create Date: 2026-08-27
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e83b19d6f4c7"
+down_revision = "d27a4f83c1e9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Plain strings: value changes no longer need ALTER TYPE and the
+    # driver skips per-row enum adaptation; validation moves to Python.
+    # The native enums stored member NAMES (e.g. MONITOR), so lowercase
+    # them into the enum VALUES the Python layer uses (e.g. monitor)
+    op.alter_column(
+        "triggers",
+        "entity_type",
+        type_=sa.String(32),
+        postgresql_using="lower(entity_type::text)",
+    )
+    op.alter_column(
+        "trigger_events",
+        "change_type",
+        type_=sa.String(32),
+        postgresql_using="lower(change_type::text)",
+    )
+    op.execute("DROP TYPE IF EXISTS entitytype")
+    op.execute("DROP TYPE IF EXISTS changetype")
+
+
+def downgrade() -> None:
+    entity_type = sa.Enum("MONITOR", "MONITOR_STATUS", "TAG", name="entitytype")
+    change_type = sa.Enum("INSERT", "UPDATE", "DELETE", name="changetype")
+    entity_type.create(op.get_bind(), checkfirst=True)
+    change_type.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "triggers",
+        "entity_type",
+        type_=entity_type,
+        postgresql_using="upper(entity_type)::entitytype",
+    )
+    op.alter_column(
+        "trigger_events",
+        "change_type",
+        type_=change_type,
+        postgresql_using="upper(change_type)::changetype",
+    )
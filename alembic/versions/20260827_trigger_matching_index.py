@@ -0,0 +1,28 @@
+"""Add composite index for CDC trigger matching
+
+Revision ID: f18b52c6a903
+Revises: c93d08a1e574
+Create Date: 2026-08-27
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f18b52c6a903"
+down_revision = "c93d08a1e574"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_triggers_entity_type_active",
+        "triggers",
+        ["entity_type", "is_active"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_triggers_entity_type_active", table_name="triggers")
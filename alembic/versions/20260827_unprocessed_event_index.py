@@ -0,0 +1,34 @@
+"""Add partial index on trigger_events (trigger_id, processed)
+
+Revision ID: d27a4f83c1e9
+Revises: b4e6d97c0a12
+Create Date: 2026-08-27
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d27a4f83c1e9"
+down_revision = "b4e6d97c0a12"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-trigger unprocessed-event lookups; partial so the index only
+    # ever holds the (small) backlog of rows still awaiting dispatch
+    op.create_index(
+        "ix_trigger_events_unprocessed",
+        "trigger_events",
+        ["trigger_id", "processed"],
+        unique=False,
+        postgresql_where=sa.text("processed = false"),
+        sqlite_where=sa.text("processed = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_trigger_events_unprocessed", table_name="trigger_events")
@@ -4,22 +4,26 @@ API dependencies module.
 This module provides dependencies for the FastAPI routes.
 """
 
-from typing import Generator
+import contextvars
+from typing import Any, AsyncGenerator, Dict, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import SessionLocal
+from app.database import AsyncSessionLocal
 
+# Per-request memoization store, populated by middleware in app.main so
+# repeated lookups of the same row within one request hit the database once
+request_cache: contextvars.ContextVar[Optional[Dict[Any, Any]]] = (
+    contextvars.ContextVar("request_cache", default=None)
+)
 
-def get_db() -> Generator[Session, None, None]:
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Get a database session.
+    Get an async database session.
 
     Yields:
-        A SQLAlchemy database session
+        A SQLAlchemy async database session
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
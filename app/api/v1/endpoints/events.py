@@ -4,60 +4,98 @@ API endpoints for managing trigger events.
 This module provides FastAPI routes for retrieving trigger events.
 """
 
+from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_db
-from app.models.trigger import ChangeType, Trigger, TriggerEvent
-from app.schemas.trigger import TriggerEventInDB
+from app.api.v1.endpoints.triggers import _get_trigger_or_404
+from app.core.cache import TTLCache
+from app.models.trigger import ChangeType, TriggerEvent
+from app.schemas.trigger import TriggerEventInDB, TriggerEventPage
 
 router = APIRouter()
 
+# Response cache for single-event reads. Only events that have already
+# been processed are cached: the event processor later fills processed,
+# response_status and processed_at on pending events, and there is no
+# invalidation path from that write back to this cache
+event_cache = TTLCache(ttl=60.0)
 
-@router.get("/", response_model=List[TriggerEventInDB])
+
+@router.get("/", response_model=TriggerEventPage)
 async def read_events(
     skip: int = 0,
     limit: int = 100,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None,
     trigger_id: Optional[int] = None,
     processed: Optional[bool] = None,
     change_type: Optional[ChangeType] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve trigger events with optional filtering.
 
+    Pagination uses a keyset cursor when ``after_created_at`` and
+    ``after_id`` are provided (the values from the last event of the
+    previous page), which stays fast on deep pages. ``skip`` is kept as a
+    fallback for shallow offsets.
+
     Args:
-        skip: Number of records to skip
+        skip: Number of records to skip (ignored when a cursor is given)
         limit: Maximum number of records to return
+        after_created_at: Cursor - created_at of the last event seen
+        after_id: Cursor - ID of the last event seen
         trigger_id: Filter by trigger ID
         processed: Filter by processed status
         change_type: Filter by change type
         db: Database session
 
     Returns:
-        List of trigger event objects
+        Page of trigger event objects with a has_more indicator
     """
-    query = db.query(TriggerEvent)
+    # TriggerEventInDB serializes no relationships, so no eager-loading
+    # options are needed here
+    stmt = select(TriggerEvent)
 
     # Apply filters if provided
     if trigger_id is not None:
-        query = query.filter(TriggerEvent.trigger_id == trigger_id)
+        stmt = stmt.where(TriggerEvent.trigger_id == trigger_id)
     if processed is not None:
-        query = query.filter(TriggerEvent.processed == processed)
+        stmt = stmt.where(TriggerEvent.processed == processed)
     if change_type is not None:
-        query = query.filter(TriggerEvent.change_type == change_type)
+        stmt = stmt.where(TriggerEvent.change_type == change_type)
 
-    # Order by creation date, newest first
-    query = query.order_by(TriggerEvent.created_at.desc())
+    # Order by creation date, newest first (ID as tie-breaker)
+    stmt = stmt.order_by(TriggerEvent.created_at.desc(), TriggerEvent.id.desc())
 
-    events = query.offset(skip).limit(limit).all()
-    return events
+    if after_created_at is not None and after_id is not None:
+        # Keyset pagination: seek directly past the cursor position
+        stmt = stmt.where(
+            tuple_(TriggerEvent.created_at, TriggerEvent.id)
+            < (after_created_at, after_id)
+        )
+    else:
+        stmt = stmt.offset(skip)
+
+    # Fetch one extra row to detect whether another page exists without a
+    # COUNT(*) over the (unbounded) events table
+    result = await db.execute(stmt.limit(limit + 1))
+    events = result.scalars().all()
+    has_more = len(events) > limit
+
+    return TriggerEventPage(
+        items=[TriggerEventInDB.model_validate(e) for e in events[:limit]],
+        has_more=has_more,
+    )
 
 
 @router.get("/{event_id}", response_model=TriggerEventInDB)
-async def read_event(event_id: int, db: Session = Depends(get_db)):
+async def read_event(event_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get a specific trigger event by ID.
 
@@ -68,46 +106,65 @@ async def read_event(event_id: int, db: Session = Depends(get_db)):
     Returns:
         The trigger event object
     """
-    event = db.query(TriggerEvent).filter(TriggerEvent.id == event_id).first()
+    cached = event_cache.get(event_id)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(select(TriggerEvent).where(TriggerEvent.id == event_id))
+    event = result.scalar_one_or_none()
     if event is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Event with ID {event_id} not found",
         )
-    return event
+    event_data = TriggerEventInDB.model_validate(event)
+    if event_data.processed:
+        # Processed events are terminal; pending ones still get their
+        # status fields written and must be re-read each time
+        event_cache.set(event_id, event_data)
+    return event_data
 
 
 @router.get("/trigger/{trigger_id}", response_model=List[TriggerEventInDB])
 async def read_trigger_events(
-    trigger_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    trigger_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get events for a specific trigger.
 
     Args:
         trigger_id: Trigger ID
-        skip: Number of records to skip
+        skip: Number of records to skip (ignored when a cursor is given)
         limit: Maximum number of records to return
+        after_created_at: Cursor - created_at of the last event seen
+        after_id: Cursor - ID of the last event seen
         db: Database session
 
     Returns:
         List of trigger event objects
     """
-    # First check if trigger exists
-    trigger = db.query(Trigger).filter(Trigger.id == trigger_id).first()
-    if trigger is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Trigger with ID {trigger_id} not found",
-        )
+    # First check if trigger exists (memoized per request)
+    await _get_trigger_or_404(db, trigger_id)
 
-    events = (
-        db.query(TriggerEvent)
-        .filter(TriggerEvent.trigger_id == trigger_id)
-        .order_by(TriggerEvent.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+    stmt = (
+        select(TriggerEvent)
+        .where(TriggerEvent.trigger_id == trigger_id)
+        .order_by(TriggerEvent.created_at.desc(), TriggerEvent.id.desc())
     )
 
-    return events
+    if after_created_at is not None and after_id is not None:
+        stmt = stmt.where(
+            tuple_(TriggerEvent.created_at, TriggerEvent.id)
+            < (after_created_at, after_id)
+        )
+    else:
+        stmt = stmt.offset(skip)
+
+    result = await db.execute(stmt.limit(limit))
+
+    return result.scalars().all()
@@ -7,29 +7,78 @@ This module provides FastAPI routes for CRUD operations on triggers.
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_db, request_cache
+from app.core.cache import TTLCache
 from app.models.trigger import EntityType, Trigger
-from app.schemas.trigger import TriggerCreate, TriggerInDB, TriggerUpdate
+from app.schemas.trigger import (
+    TriggerCreate,
+    TriggerInDB,
+    TriggerInDBList,
+    TriggerUpdate,
+)
 
 router = APIRouter()
 
+# Response cache for trigger reads; cleared by every write endpoint
+trigger_cache = TTLCache(ttl=60.0)
+
+
+async def _get_trigger_or_404(db: AsyncSession, trigger_id: int) -> Trigger:
+    """
+    Get a trigger by ID, raising a 404 if it does not exist.
+
+    Lookups are memoized per request, so several dependencies or handlers
+    asking for the same trigger share one SELECT.
+
+    Args:
+        db: Database session
+        trigger_id: Trigger ID
+
+    Returns:
+        The trigger object
+    """
+    cache = request_cache.get()
+    cache_key = ("trigger", trigger_id)
+    if cache is not None and cache_key in cache:
+        return cache[cache_key]
+
+    result = await db.execute(select(Trigger).where(Trigger.id == trigger_id))
+    trigger = result.scalar_one_or_none()
+    if trigger is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Trigger with ID {trigger_id} not found",
+        )
+
+    if cache is not None:
+        cache[cache_key] = trigger
+    return trigger
+
 
 @router.get("/", response_model=List[TriggerInDB])
 async def read_triggers(
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
     entity_type: Optional[EntityType] = None,
     is_active: Optional[bool] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve triggers with optional filtering.
 
+    Pagination uses a keyset cursor when ``after_id`` is provided (the ID
+    of the last trigger from the previous page); ``skip`` is kept as a
+    fallback for shallow offsets.
+
     Args:
-        skip: Number of records to skip
+        skip: Number of records to skip (ignored when a cursor is given)
         limit: Maximum number of records to return
+        after_id: Cursor - ID of the last trigger seen
         entity_type: Filter by entity type
         is_active: Filter by active status
         db: Database session
@@ -37,20 +86,35 @@ async def read_triggers(
     Returns:
         List of trigger objects
     """
-    query = db.query(Trigger)
+    cache_key = ("list", skip, limit, after_id, entity_type, is_active)
+    cached = trigger_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    stmt = select(Trigger)
 
     # Apply filters if provided
     if entity_type is not None:
-        query = query.filter(Trigger.entity_type == entity_type)
+        stmt = stmt.where(Trigger.entity_type == entity_type)
     if is_active is not None:
-        query = query.filter(Trigger.is_active == is_active)
+        stmt = stmt.where(Trigger.is_active == is_active)
+
+    stmt = stmt.order_by(Trigger.id)
+
+    if after_id is not None:
+        # Keyset pagination: seek directly past the cursor position
+        stmt = stmt.where(Trigger.id > after_id)
+    else:
+        stmt = stmt.offset(skip)
 
-    triggers = query.offset(skip).limit(limit).all()
+    result = await db.execute(stmt.limit(limit))
+    triggers = TriggerInDBList.validate_python(result.scalars().all())
+    trigger_cache.set(cache_key, triggers)
     return triggers
 
 
 @router.post("/", response_model=TriggerInDB, status_code=status.HTTP_201_CREATED)
-async def create_trigger(trigger_in: TriggerCreate, db: Session = Depends(get_db)):
+async def create_trigger(trigger_in: TriggerCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new trigger.
 
@@ -61,28 +125,30 @@ async def create_trigger(trigger_in: TriggerCreate, db: Session = Depends(get_db
     Returns:
         The created trigger
     """
-    # Check if trigger with the same name already exists
-    existing_trigger = db.query(Trigger).filter(Trigger.name == trigger_in.name).first()
-    if existing_trigger:
+    # Convert trigger_in to model data
+    trigger_data = trigger_in.model_dump()
+
+    # Create new trigger in a single INSERT ... RETURNING round trip; the
+    # unique constraint on name catches duplicates without a separate
+    # existence check, so there is no race window between check and insert
+    stmt = insert(Trigger).values(**trigger_data).returning(Trigger)
+    try:
+        result = await db.execute(stmt)
+        db_trigger = result.scalar_one()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Trigger with name '{trigger_in.name}' already exists",
         )
 
-    # Convert trigger_in to model data
-    trigger_data = trigger_in.model_dump()
-
-    # Create new trigger
-    db_trigger = Trigger(**trigger_data)
-    db.add(db_trigger)
-    db.commit()
-    db.refresh(db_trigger)
-
+    trigger_cache.clear()
     return db_trigger
 
 
 @router.get("/{trigger_id}", response_model=TriggerInDB)
-async def read_trigger(trigger_id: int, db: Session = Depends(get_db)):
+async def read_trigger(trigger_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get a specific trigger by ID.
 
@@ -93,18 +159,20 @@ async def read_trigger(trigger_id: int, db: Session = Depends(get_db)):
     Returns:
         The trigger object
     """
-    trigger = db.query(Trigger).filter(Trigger.id == trigger_id).first()
-    if trigger is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Trigger with ID {trigger_id} not found",
-        )
-    return trigger
+    cache_key = ("detail", trigger_id)
+    cached = trigger_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    trigger = await _get_trigger_or_404(db, trigger_id)
+    trigger_data = TriggerInDB.model_validate(trigger)
+    trigger_cache.set(cache_key, trigger_data)
+    return trigger_data
 
 
 @router.put("/{trigger_id}", response_model=TriggerInDB)
 async def update_trigger(
-    trigger_id: int, trigger_in: TriggerUpdate, db: Session = Depends(get_db)
+    trigger_id: int, trigger_in: TriggerUpdate, db: AsyncSession = Depends(get_db)
 ):
     """
     Update a trigger.
@@ -117,27 +185,32 @@ async def update_trigger(
     Returns:
         The updated trigger
     """
-    trigger = db.query(Trigger).filter(Trigger.id == trigger_id).first()
+    update_data = trigger_in.model_dump(exclude_unset=True)
+    if not update_data:
+        # Nothing to change; just return the current row
+        return await _get_trigger_or_404(db, trigger_id)
+
+    # Single round trip: update and read back the row in one statement
+    result = await db.execute(
+        update(Trigger)
+        .where(Trigger.id == trigger_id)
+        .values(**update_data)
+        .returning(Trigger)
+    )
+    trigger = result.scalar_one_or_none()
     if trigger is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Trigger with ID {trigger_id} not found",
         )
+    await db.commit()
 
-    # Update trigger fields from trigger_in
-    update_data = trigger_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(trigger, field, value)
-
-    db.add(trigger)
-    db.commit()
-    db.refresh(trigger)
-
+    trigger_cache.clear()
     return trigger
 
 
 @router.delete("/{trigger_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_trigger(trigger_id: int, db: Session = Depends(get_db)):
+async def delete_trigger(trigger_id: int, db: AsyncSession = Depends(get_db)):
     """
     Delete a trigger.
 
@@ -145,21 +218,17 @@ async def delete_trigger(trigger_id: int, db: Session = Depends(get_db)):
         trigger_id: Trigger ID
         db: Database session
     """
-    trigger = db.query(Trigger).filter(Trigger.id == trigger_id).first()
-    if trigger is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Trigger with ID {trigger_id} not found",
-        )
+    trigger = await _get_trigger_or_404(db, trigger_id)
 
-    db.delete(trigger)
-    db.commit()
+    await db.delete(trigger)
+    await db.commit()
 
+    trigger_cache.clear()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.post("/{trigger_id}/activate", response_model=TriggerInDB)
-async def activate_trigger(trigger_id: int, db: Session = Depends(get_db)):
+async def activate_trigger(trigger_id: int, db: AsyncSession = Depends(get_db)):
     """
     Activate a trigger.
 
@@ -170,23 +239,26 @@ async def activate_trigger(trigger_id: int, db: Session = Depends(get_db)):
     Returns:
         The activated trigger
     """
-    trigger = db.query(Trigger).filter(Trigger.id == trigger_id).first()
+    result = await db.execute(
+        update(Trigger)
+        .where(Trigger.id == trigger_id)
+        .values(is_active=True)
+        .returning(Trigger)
+    )
+    trigger = result.scalar_one_or_none()
     if trigger is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Trigger with ID {trigger_id} not found",
         )
+    await db.commit()
 
-    trigger.is_active = True
-    db.add(trigger)
-    db.commit()
-    db.refresh(trigger)
-
+    trigger_cache.clear()
     return trigger
 
 
 @router.post("/{trigger_id}/deactivate", response_model=TriggerInDB)
-async def deactivate_trigger(trigger_id: int, db: Session = Depends(get_db)):
+async def deactivate_trigger(trigger_id: int, db: AsyncSession = Depends(get_db)):
     """
     Deactivate a trigger.
 
@@ -197,16 +269,19 @@ async def deactivate_trigger(trigger_id: int, db: Session = Depends(get_db)):
     Returns:
         The deactivated trigger
     """
-    trigger = db.query(Trigger).filter(Trigger.id == trigger_id).first()
+    result = await db.execute(
+        update(Trigger)
+        .where(Trigger.id == trigger_id)
+        .values(is_active=False)
+        .returning(Trigger)
+    )
+    trigger = result.scalar_one_or_none()
     if trigger is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Trigger with ID {trigger_id} not found",
         )
+    await db.commit()
 
-    trigger.is_active = False
-    db.add(trigger)
-    db.commit()
-    db.refresh(trigger)
-
+    trigger_cache.clear()
     return trigger
@@ -0,0 +1,37 @@
+"""
+CDC event type module.
+
+This module defines the normalized change event handed from the
+replication stream to downstream processing.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Optional
+
+import msgspec
+
+from app.models.trigger import ChangeType, EntityType
+
+
+class CDCEvent(msgspec.Struct, gc=False):
+    """
+    A normalized database change event.
+
+    Defined as a msgspec.Struct rather than a dict: instances are
+    slot-based, so the hot path skips per-event dict construction and
+    downstream code reads fields via cheap attribute access.
+
+    Attributes:
+        entity_type: Type of entity that changed
+        change_type: Type of change (insert, update, delete)
+        old_data: Row data before the change, if any
+        new_data: Row data after the change, if any; may be a lazy
+            column-oriented view rather than a plain dict
+        table_name: Name of the table the change belongs to
+    """
+
+    entity_type: EntityType
+    change_type: ChangeType
+    old_data: Optional[Mapping[str, Any]]
+    new_data: Optional[Mapping[str, Any]]
+    table_name: str
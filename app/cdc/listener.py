@@ -7,9 +7,10 @@ This module implements the listener for database changes.
 import asyncio
 import logging
 import threading
-from typing import Any, Dict
+from typing import List
 
-from app.cdc.connection import CDCConnection
+from app.cdc.event import CDCEvent
+from app.core.config import settings
 from app.events.processor import EventProcessor
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,8 @@ class CDCListener:
         self.cdc_connection = None
         self.listener_thread = None
         self.is_running = False
+        self._loop = None
+        self._loop_thread = None
 
     def start(self):
         """
@@ -43,8 +46,26 @@ class CDCListener:
             logger.warning("CDC listener is already running")
             return
 
+        # Imported here rather than at module scope so that importing
+        # the app (and the test suite) never pulls in psycopg; only a
+        # started listener needs the driver
+        if settings.CDC_MODE == "notify":
+            from app.cdc.notify import NotifyCDCConnection as connection_cls
+        else:
+            from app.cdc.connection import CDCConnection as connection_cls
+
         self.is_running = True
-        self.cdc_connection = CDCConnection()
+        self.cdc_connection = connection_cls()
+
+        # One persistent event loop for all async processing, so each
+        # batch reuses the processor's HTTP connection pool instead of
+        # paying loop setup/teardown per batch
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            daemon=True,
+        )
+        self._loop_thread.start()
 
         # Start the listener in a separate thread
         self.listener_thread = threading.Thread(
@@ -64,23 +85,53 @@ class CDCListener:
         """
         try:
             logger.info("Starting CDC replication")
-            self.cdc_connection.start_replication(self._process_change_event)
+            self.cdc_connection.start_replication(self._process_change_batch)
         except Exception as e:
             logger.error("CDC listener thread error: %s", str(e))
             self.is_running = False
 
-    def _process_change_event(self, event: Dict[str, Any]):
+    def _process_change_batch(self, events: List[CDCEvent]):
         """
-        Process a change event from the CDC connection.
+        Process a batch of change events from the CDC connection.
+
+        Events are partitioned by entity type so the monitor, status and
+        tag streams hit the database concurrently; wal2json preserves
+        per-row ordering within each partition.
 
         Args:
-            event: The change event to process
+            events: The change events to process
         """
         try:
-            # Create an async task to process the event
-            asyncio.run(self.event_processor.process_change_event(event))
+            partitions = {}
+            for event in events:
+                partitions.setdefault(event.entity_type, []).append(event)
+
+            if len(partitions) <= 1:
+                coro = self.event_processor.process_change_events(events)
+            else:
+                coro = self._process_partitions(list(partitions.values()))
+
+            # Run the batch on the persistent loop; blocking on the
+            # result keeps backpressure on the CDC worker threads and
+            # holds back WAL acknowledgement until the rows are stored
+            future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+            future.result()
         except Exception as e:
-            logger.error("Error processing change event: %s", str(e))
+            # Re-raise so the CDC worker skips acknowledging this
+            # batch's WAL position and it is redelivered after a restart
+            logger.error("Error processing change batch: %s", str(e))
+            raise
+
+    async def _process_partitions(self, partitions: List[List[CDCEvent]]):
+        """
+        Process per-entity-type event partitions concurrently.
+
+        Args:
+            partitions: Event batches, one per entity type
+        """
+        await asyncio.gather(
+            *(self.event_processor.process_change_events(batch) for batch in partitions)
+        )
 
     def stop(self):
         """
@@ -99,4 +150,21 @@ class CDCListener:
         if self.listener_thread and self.listener_thread.is_alive():
             self.listener_thread.join(timeout=5)  # Wait up to 5 seconds
 
+        # Drain pending notification batches on the persistent loop
+        # while it is still running; the processor's queue and workers
+        # are bound to it and unreachable once it stops
+        try:
+            self.event_processor.shutdown()
+        except Exception as e:
+            logger.error("Error draining event processor: %s", str(e))
+
+        # Shut down the persistent event loop
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._loop_thread and self._loop_thread.is_alive():
+                self._loop_thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+
         logger.info("Stopped CDC listener")
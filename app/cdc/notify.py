@@ -0,0 +1,247 @@
+"""
+LISTEN/NOTIFY CDC connection module.
+
+This module provides an alternative change source to logical
+replication: AFTER-row triggers on the watched tables emit pg_notify
+payloads, and this connection listens on the channel and turns them
+into change events. It avoids WAL decoding entirely at the cost of
+at-most-once delivery (notifications are lost if no listener is
+connected). Select it with CDC_MODE=notify.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List
+
+try:
+    # orjson parses notify payloads several times faster than stdlib json
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as json_loads
+
+import psycopg
+from psycopg import sql
+from psycopg.rows import dict_row
+
+from app.cdc.connection import KIND_TO_CHANGE, TABLE_TO_ENTITY
+from app.cdc.event import CDCEvent
+from app.core.config import settings
+from app.models.trigger import ChangeType
+
+logger = logging.getLogger(__name__)
+
+# Tables whose changes are published on the notify channel
+WATCHED_TABLES = ["monitor", "monitor_statuses", "tags"]
+
+# Number of notifications to accumulate before flushing a batch
+NOTIFY_BATCH_SIZE = 256
+
+# pg_notify payloads are capped at 8000 bytes, so the trigger function
+# sends only identifiers and the listener fetches the row afterwards
+NOTIFY_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$
+DECLARE
+  rec record;
+BEGIN
+  IF TG_OP = 'DELETE' THEN
+    rec := OLD;
+  ELSE
+    rec := NEW;
+  END IF;
+  PERFORM pg_notify(
+    {channel},
+    json_build_object(
+      'table', TG_TABLE_NAME,
+      'kind', lower(TG_OP),
+      'id', rec.id
+    )::text
+  );
+  RETURN rec;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+class NotifyCDCConnection:
+    """
+    Change source backed by LISTEN/NOTIFY instead of logical replication.
+
+    Exposes the same start_replication/stop_replication interface as
+    CDCConnection so the listener can switch between the two via
+    settings.CDC_MODE.
+    """
+
+    def __init__(self, channel: str = None):
+        """
+        Initialize the notify connection.
+
+        Args:
+            channel: Name of the notification channel to listen on
+        """
+        self.channel = channel or settings.CDC_NOTIFY_CHANNEL
+        self.conn = None
+        self._stop_event = threading.Event()
+        self._create_notify_triggers()
+
+    def _db_url(self) -> str:
+        """
+        Get the monitors database URL with a normalized scheme.
+
+        Returns:
+            Database connection string
+        """
+        db_url = settings.MONITORS_DATABASE_URL
+        if db_url.startswith("postgres://"):
+            db_url = db_url.replace("postgres://", "postgresql://", 1)
+        return db_url
+
+    def _create_notify_triggers(self):
+        """
+        Create the notify function and row triggers on the watched tables.
+        """
+        try:
+            with psycopg.connect(self._db_url(), autocommit=True) as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        sql.SQL(NOTIFY_FUNCTION_SQL).format(
+                            function=sql.Identifier(f"{self.channel}_notify"),
+                            channel=sql.Literal(self.channel),
+                        )
+                    )
+                    for table in WATCHED_TABLES:
+                        cursor.execute(
+                            sql.SQL(
+                                "CREATE OR REPLACE TRIGGER {trigger} "
+                                "AFTER INSERT OR UPDATE OR DELETE ON public.{table} "
+                                "FOR EACH ROW EXECUTE FUNCTION {function}()"
+                            ).format(
+                                trigger=sql.Identifier(f"{self.channel}_{table}"),
+                                table=sql.Identifier(table),
+                                function=sql.Identifier(f"{self.channel}_notify"),
+                            )
+                        )
+            logger.info("Created notify triggers on channel %s", self.channel)
+        except Exception as e:
+            logger.error("Failed to create notify triggers: %s", str(e))
+            raise
+
+    def _fetch_row(self, cursor, table_name: str, entity_id: int) -> Dict[str, Any]:
+        """
+        Fetch the current row for a notified change.
+
+        Args:
+            cursor: Cursor on the lookup connection
+            table_name: Table the change belongs to
+            entity_id: Primary key of the changed row
+
+        Returns:
+            The row as a dict, or None if it no longer exists
+        """
+        cursor.execute(
+            sql.SQL("SELECT * FROM public.{table} WHERE id = %s").format(
+                table=sql.Identifier(table_name)
+            ),
+            (entity_id,),
+        )
+        return cursor.fetchone()
+
+    def _event_from_notify(self, cursor, payload: Dict[str, Any]) -> CDCEvent:
+        """
+        Build a change event from a notify payload.
+
+        Args:
+            cursor: Cursor on the lookup connection
+            payload: Decoded notify payload with table, kind, and id
+
+        Returns:
+            The change event, or None for tables/kinds we don't watch
+        """
+        table_name = payload.get("table")
+        entity_type = TABLE_TO_ENTITY.get(table_name)
+        if entity_type is None:
+            return None
+
+        change_type = KIND_TO_CHANGE.get(payload.get("kind"))
+        if change_type is None:
+            return None
+
+        entity_id = payload.get("id")
+        if change_type is ChangeType.DELETE:
+            old_data = {"id": entity_id}
+            new_data = None
+        else:
+            # The payload is id-only (pg_notify size cap); fetch the row
+            old_data = None
+            new_data = self._fetch_row(cursor, table_name, entity_id)
+            if new_data is None:
+                # Row already gone; nothing meaningful to deliver
+                return None
+
+        return CDCEvent(
+            entity_type=entity_type,
+            change_type=change_type,
+            old_data=old_data,
+            new_data=new_data,
+            table_name=table_name,
+        )
+
+    def start_replication(self, callback: Callable[[List[CDCEvent]], None]):
+        """
+        Listen for notifications and deliver change events in batches.
+
+        Args:
+            callback: Function to call with each batch of change events
+        """
+        self._stop_event.clear()
+
+        try:
+            with psycopg.connect(self._db_url(), autocommit=True) as conn:
+                self.conn = conn
+                conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+                logger.info("Listening on channel %s", self.channel)
+
+                with psycopg.connect(
+                    self._db_url(), row_factory=dict_row
+                ) as lookup_conn:
+                    with lookup_conn.cursor() as lookup_cursor:
+                        batch: List[CDCEvent] = []
+                        while not self._stop_event.is_set():
+                            # Collect whatever arrives within the window,
+                            # then flush the batch downstream
+                            for notify in conn.notifies(timeout=1.0):
+                                try:
+                                    payload = json_loads(notify.payload)
+                                    event = self._event_from_notify(
+                                        lookup_cursor, payload
+                                    )
+                                except Exception as e:
+                                    logger.error("Bad notify payload: %s", str(e))
+                                    continue
+                                if event is not None:
+                                    batch.append(event)
+                                if len(batch) >= NOTIFY_BATCH_SIZE:
+                                    break
+                            if batch:
+                                callback(list(batch))
+                                batch.clear()
+
+        except Exception as e:
+            if not self._stop_event.is_set():
+                logger.error("Notify listener error: %s", str(e))
+                raise
+        finally:
+            self.conn = None
+
+    def stop_replication(self):
+        """
+        Stop listening and close the connection.
+        """
+        self._stop_event.set()
+        if self.conn:
+            try:
+                self.conn.close()
+                logger.info("Stopped notify listener")
+            except Exception as e:
+                logger.error("Error stopping notify listener: %s", str(e))
+            finally:
+                self.conn = None
@@ -0,0 +1,76 @@
+"""
+In-process cache module.
+
+This module provides a small TTL cache used to serve hot read endpoints
+without hitting the database. Entries are invalidated explicitly by the
+write endpoints and expire automatically after their time-to-live.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    A thread-safe cache with per-entry expiry.
+
+    Attributes:
+        ttl: Seconds an entry stays valid after being stored
+        maxsize: Maximum number of entries kept before the oldest is evicted
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after being stored
+            maxsize: Maximum number of entries to keep
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            if len(self._entries) >= self.maxsize and key not in self._entries:
+                # Evict the oldest entry to stay within bounds
+                oldest_key = next(iter(self._entries))
+                del self._entries[oldest_key]
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
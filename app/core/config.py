@@ -22,6 +22,14 @@ class Settings(BaseSettings):
         REPLICATION_SLOT: PostgreSQL replication slot name
         PUBLICATION_NAME: PostgreSQL publication name
         NOTIFICATION_ENDPOINT: API endpoint to call on change events
+        CDC_POOL_MIN_SIZE: Minimum connections kept in the CDC pool
+        CDC_POOL_MAX_SIZE: Maximum connections in the CDC pool
+        CDC_POOL_TIMEOUT: Seconds to wait for a CDC pool connection
+        CDC_POOL_MAX_LIFETIME: Seconds before a CDC pool connection is recycled
+        CDC_MODE: Change source, "replication" (WAL) or "notify" (LISTEN/NOTIFY)
+        CDC_NOTIFY_CHANNEL: Channel name used by the notify mode
+        CDC_BATCH_SIZE: Change events accumulated before a batch is flushed
+        CDC_BATCH_TIMEOUT_MS: Max milliseconds a partial batch waits to flush
     """
 
     # Required configuration with defaults for testing
@@ -39,6 +47,20 @@ class Settings(BaseSettings):
     PUBLICATION_NAME: str = "triggers_publication"
     NOTIFICATION_ENDPOINT: str = "http://localhost:8000/api/v1/notify"
 
+    # CDC connection pool tuning
+    CDC_POOL_MIN_SIZE: int = 5
+    CDC_POOL_MAX_SIZE: int = 20
+    CDC_POOL_TIMEOUT: int = 30
+    CDC_POOL_MAX_LIFETIME: int = 3600
+
+    # Change capture mode
+    CDC_MODE: str = "replication"
+    CDC_NOTIFY_CHANNEL: str = "trigger_changes"
+
+    # Change batching
+    CDC_BATCH_SIZE: int = 256
+    CDC_BATCH_TIMEOUT_MS: int = 500
+
     model_config = ConfigDict(case_sensitive=True, env_file=".env")
 
 
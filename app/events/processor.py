@@ -4,23 +4,53 @@ Event processor module.
 This module handles processing of change events detected by the CDC listener.
 """
 
-import json
+import asyncio
 import logging
 from datetime import UTC, datetime
-from typing import Any, Dict, List
+from typing import List, Optional
 
 import httpx
+
+try:
+    # orjson encodes notification payloads (datetimes included) natively
+    # and several times faster than stdlib json
+    from orjson import dumps as json_dumps_bytes
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    from json import dumps as _json_dumps
+
+    def json_dumps_bytes(obj) -> bytes:
+        return _json_dumps(obj, default=str).encode()
+
+
+from sqlalchemy import insert, lambda_stmt, select, text, update
 from sqlalchemy.orm import Session
 
+from app.cdc.event import CDCEvent
+from app.core.cache import TTLCache
 from app.database import SessionLocal
 from app.models.trigger import Trigger, TriggerEvent
-from app.schemas.trigger import (
-    DatabaseChangeNotification,
-    TriggerEventUpdate,
-)
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cached trigger list stays valid before it is re-read from
+# the database
+TRIGGER_CACHE_TTL = 10.0
+
+# Sentinel distinguishing an absent key from a stored None in compiled
+# filter matchers
+_MISSING = object()
+
+# Bounds for the notification delivery queue (measured in batches) and
+# its worker tasks
+NOTIFY_QUEUE_MAXSIZE = 64
+NOTIFY_WORKER_COUNT = 8
+
+# Compiled filter matchers keyed by (trigger id, updated_at); updating
+# a trigger changes updated_at and thereby invalidates its entry
+_matcher_cache = {}
+MATCHER_CACHE_MAXSIZE = 1024
+
 
 class EventProcessor:
     """
@@ -36,81 +66,355 @@ class EventProcessor:
         """
         Initialize the event processor.
         """
-        self.client = httpx.AsyncClient(timeout=30.0)  # 30 second timeout
+        self.client = httpx.AsyncClient(
+            timeout=30.0,  # 30 second timeout
+            # Enough keep-alive connections that a whole batch of
+            # notifications can go out concurrently
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        )
+        # Matching triggers cached per (entity_type, change_type); the
+        # short TTL acts as a periodic reload, so trigger CRUD is picked
+        # up within seconds without a DB round trip per change event
+        self._trigger_cache = TTLCache(ttl=TRIGGER_CACHE_TTL)
+        # Notification delivery runs on dedicated worker tasks fed by a
+        # bounded queue, created lazily inside the running event loop;
+        # the loop is remembered so shutdown can reach the queue and
+        # workers from other threads
+        self._notify_queue = None
+        self._notify_workers = []
+        self._notify_loop = None
+
+    def _ensure_notify_workers(self):
+        """
+        Create the notification queue and worker tasks if needed.
 
-    def _get_db(self) -> Session:
+        Must be called from within the event loop the processor runs on.
         """
-        Get a database session.
+        if self._notify_queue is None:
+            self._notify_loop = asyncio.get_running_loop()
+            self._notify_queue = asyncio.Queue(maxsize=NOTIFY_QUEUE_MAXSIZE)
+            self._notify_workers = [
+                asyncio.ensure_future(self._notify_worker())
+                for _ in range(NOTIFY_WORKER_COUNT)
+            ]
+
+    async def _notify_worker(self):
+        """
+        Deliver queued notification batches.
 
-        Returns:
-            A SQLAlchemy database session
+        Runs as a long-lived task; failures are logged per batch so one
+        bad batch never stops the worker.
+        """
+        while True:
+            work, inserted = await self._notify_queue.get()
+            try:
+                await self._deliver_batch(work, inserted)
+            except Exception as e:
+                logger.error("Error delivering notification batch: %s", str(e))
+            finally:
+                self._notify_queue.task_done()
+
+    async def _deliver_batch(self, work, inserted):
+        """
+        Send a batch's notifications and record their statuses.
+
+        Args:
+            work: (trigger, event, row) tuples for the batch
+            inserted: (id, created_at) rows returned by the batch INSERT
+        """
+        # Group the batch by endpoint so each endpoint receives a single
+        # POST, amortizing connection and framing overhead when several
+        # triggers share one
+        groups = {}
+        for (trigger, event, row), (event_id, created_at) in zip(work, inserted):
+            payload = self._build_payload(trigger, row, created_at, event)
+            groups.setdefault(trigger.endpoint, ([], []))
+            payloads, event_ids = groups[trigger.endpoint]
+            payloads.append(payload)
+            event_ids.append(event_id)
+
+        # Send to all endpoints concurrently; _send_notification returns
+        # a status code even on failure, so gather never short-circuits
+        # the batch
+        response_statuses = await asyncio.gather(
+            *(
+                self._send_notification(endpoint, payloads)
+                for endpoint, (payloads, _) in groups.items()
+            )
+        )
+        processed_at = datetime.now(UTC)
+        status_updates = [
+            {
+                "id": event_id,
+                "processed": True,
+                "response_status": response_status,
+                "processed_at": processed_at,
+            }
+            for (_, event_ids), response_status in zip(
+                groups.values(), response_statuses
+            )
+            for event_id in event_ids
+        ]
+
+        # One batched UPDATE for all notification statuses; off-loop so
+        # the blocking session never stalls the other workers
+        await asyncio.to_thread(self._record_statuses, status_updates)
+
+    def _record_statuses(self, status_updates: List[dict]):
+        """
+        Record notification statuses with one batched UPDATE.
+
+        Runs on a worker thread; all database access here is blocking.
+
+        Args:
+            status_updates: Value dicts keyed by primary key, one per
+                trigger event
         """
         db = SessionLocal()
         try:
-            return db
+            if db.get_bind().dialect.name == "postgresql":
+                # Status rows are the one loss-tolerant write here: if
+                # this commit is lost the events merely stay
+                # processed=false and are redelivered, so the fsync can
+                # be skipped for this transaction only. Event storage
+                # must stay synchronous - its commit gates WAL
+                # acknowledgment
+                db.execute(text("SET LOCAL synchronous_commit = off"))
+            # ORM bulk UPDATE by primary key: one executemany statement
+            # for the whole batch
+            db.execute(update(TriggerEvent), status_updates)
+            db.commit()
         except Exception:
-            db.close()
+            db.rollback()
             raise
+        finally:
+            db.close()
 
-    async def process_change_event(self, event: Dict[str, Any]):
+    async def process_change_events(self, events: List[CDCEvent]):
         """
-        Process a change event from the CDC listener.
+        Process a batch of change events from the CDC listener.
+
+        The whole batch shares one database session and is written with
+        a single multi-row INSERT. The matching and INSERT work is
+        synchronous SQLAlchemy, so it runs off-loop via a worker thread;
+        concurrent batches (the listener's per-entity-type partitions)
+        therefore genuinely overlap instead of serializing on the event
+        loop. Notification delivery is handed to the worker queue, so
+        this returns — and WAL acknowledgment proceeds — without
+        waiting on endpoint latency.
 
         Args:
-            event: The change event to process
+            events: The change events to process
         """
-        try:
-            # Get matching triggers for this event
-            matching_triggers = self._find_matching_triggers(event)
+        if not events:
+            return
+
+        work, inserted = await asyncio.to_thread(self._store_events, events)
+        if not work:
+            return
+
+        # Hand delivery to the workers; put() blocks when the queue is
+        # full, so a consistently slow endpoint still applies
+        # backpressure instead of growing an unbounded backlog
+        self._ensure_notify_workers()
+        await self._notify_queue.put((work, inserted))
+
+    def _store_events(self, events: List[CDCEvent]):
+        """
+        Match a batch of events against triggers and store their rows.
+
+        Runs on a worker thread; all database access here is blocking.
 
-            if not matching_triggers:
-                logger.debug("No matching triggers for event: %s", event)
-                return
+        Args:
+            events: The change events to store
 
-            # Process each matching trigger
-            for trigger in matching_triggers:
-                await self._process_trigger(trigger, event)
+        Returns:
+            Tuple of (work, inserted) where work holds
+            (trigger, event, row) tuples and inserted the corresponding
+            (id, created_at) rows from the batch INSERT
+        """
+        db = SessionLocal()
+        try:
+            # Pair each event with the triggers it fires and build the
+            # rows to insert
+            work = []
+            for event in events:
+                try:
+                    matching_triggers = self._find_matching_triggers(db, event)
+                    if not matching_triggers:
+                        logger.debug("No matching triggers for event: %s", event)
+                        continue
+
+                    entity_id = self._get_entity_id(event)
+                    # Materialize the (possibly lazy) row views once per
+                    # event; the JSON columns need real dicts
+                    old_data = (
+                        dict(event.old_data) if event.old_data is not None else None
+                    )
+                    new_data = (
+                        dict(event.new_data) if event.new_data is not None else None
+                    )
+                    for trigger in matching_triggers:
+                        work.append(
+                            (
+                                trigger,
+                                event,
+                                {
+                                    "trigger_id": trigger.id,
+                                    "entity_id": entity_id,
+                                    "change_type": event.change_type.value,
+                                    "old_data": old_data,
+                                    "new_data": new_data,
+                                    "processed": False,
+                                },
+                            )
+                        )
+                except Exception as e:
+                    logger.error("Error processing change event: %s", str(e))
+
+            if not work:
+                return [], []
+
+            # One multi-row INSERT for the whole batch; RETURNING rows
+            # must come back in parameter order because delivery zips
+            # them against the work list
+            result = db.execute(
+                insert(TriggerEvent).returning(
+                    TriggerEvent.id,
+                    TriggerEvent.created_at,
+                    sort_by_parameter_order=True,
+                ),
+                [row for _, _, row in work],
+            )
+            inserted = result.all()
+            db.commit()
+            return work, inserted
 
         except Exception as e:
-            logger.error("Error processing change event: %s", str(e))
+            db.rollback()
+            # Propagate so the CDC layer does not acknowledge WAL for a
+            # batch that was never stored
+            logger.error("Error processing change batch: %s", str(e))
+            raise
+        finally:
+            db.close()
+
+    async def process_change_event(self, event: CDCEvent):
+        """
+        Process a single change event from the CDC listener.
+
+        Args:
+            event: The change event to process
+        """
+        await self.process_change_events([event])
 
-    def _find_matching_triggers(self, event: Dict[str, Any]) -> List[Trigger]:
+    def _find_matching_triggers(self, db: Session, event: CDCEvent) -> List[Trigger]:
         """
         Find triggers that match the given event.
 
         Args:
+            db: Database session
             event: The change event to match
 
         Returns:
             List of matching Trigger objects
         """
-        entity_type = event["entity_type"]
-        change_type = event["change_type"]
-
-        db = self._get_db()
-        try:
-            # Query for active triggers matching the entity type and change type
-            triggers = (
-                db.query(Trigger)
-                .filter(
-                    Trigger.is_active is True,
+        entity_type = event.entity_type
+        change_type = event.change_type
+
+        # Serve repeat lookups from the in-process cache; one query per
+        # (entity_type, change_type) per TTL window instead of per event
+        cache_key = (entity_type, change_type)
+        triggers = self._trigger_cache.get(cache_key)
+        if triggers is None:
+            # Query active triggers for the entity type; the composite
+            # (entity_type, is_active) index serves this, while matching
+            # change_types happens here in Python since a substring scan
+            # on the JSON column can't use an index. lambda_stmt skips
+            # re-constructing the select on every cache miss; entity_type
+            # is tracked as a bound parameter
+            stmt = lambda_stmt(
+                lambda: select(Trigger).where(
+                    Trigger.is_active.is_(True),
                     Trigger.entity_type == entity_type,
-                    Trigger.change_types.contains(json.dumps([change_type])),
                 )
-                .all()
             )
-
-            # Further filter based on filter_condition if present
-            matching_triggers = []
+            candidates = db.execute(stmt).scalars().all()
+            triggers = [
+                trigger
+                for trigger in candidates
+                if change_type in (trigger.change_types or [])
+            ]
+            # Detach the instances so cached triggers stay readable
+            # after this session commits or closes, and attach each
+            # trigger's compiled filter matcher
             for trigger in triggers:
-                if self._check_filter_condition(trigger, event):
-                    matching_triggers.append(trigger)
+                db.expunge(trigger)
+                trigger._matcher = self._matcher_for(trigger)
+            self._trigger_cache.set(cache_key, triggers)
 
-            return matching_triggers
-        finally:
-            db.close()
+        # Further filter based on filter_condition if present
+        matching_triggers = []
+        for trigger in triggers:
+            if self._check_filter_condition(trigger, event):
+                matching_triggers.append(trigger)
 
-    def _check_filter_condition(self, trigger: Trigger, event: Dict[str, Any]) -> bool:
+        return matching_triggers
+
+    def _matcher_for(self, trigger: Trigger):
+        """
+        Get the compiled filter matcher for a trigger.
+
+        Compiled matchers are kept in a module-level cache keyed by
+        (id, updated_at), so they survive trigger-cache TTL reloads and
+        any update to a trigger rotates the key and drops the stale
+        matcher automatically.
+
+        Args:
+            trigger: The trigger to get a matcher for
+
+        Returns:
+            The compiled matcher, or None when there is no condition
+        """
+        if not trigger.filter_condition:
+            return None
+
+        key = (trigger.id, trigger.updated_at)
+        matcher = _matcher_cache.get(key)
+        if matcher is None:
+            if len(_matcher_cache) >= MATCHER_CACHE_MAXSIZE:
+                # Entries for updated or deleted triggers are never hit
+                # again; a full reset is the cheapest way to shed them
+                _matcher_cache.clear()
+            matcher = self._compile_filter(trigger.filter_condition)
+            _matcher_cache[key] = matcher
+        return matcher
+
+    @staticmethod
+    def _compile_filter(filter_condition):
+        """
+        Compile a filter condition into a matcher callable.
+
+        Args:
+            filter_condition: Mapping of field names to required values
+
+        Returns:
+            A callable taking the event data and returning whether it
+            matches, or None when there is no condition
+        """
+        if not filter_condition:
+            return None
+
+        # The sentinel keeps "key is missing" distinct from "value is
+        # None", matching the semantics of a key-by-key dict check
+        missing = _MISSING
+        items = tuple(filter_condition.items())
+        if len(items) == 1:
+            key, value = items[0]
+            return lambda data: data.get(key, missing) == value
+        return lambda data: all(data.get(key, missing) == value for key, value in items)
+
+    def _check_filter_condition(self, trigger: Trigger, event: CDCEvent) -> bool:
         """
         Check if the event matches the trigger's filter condition.
 
@@ -126,69 +430,21 @@ class EventProcessor:
             return True
 
         try:
-            # Get the data to check against the filter
-            data = event.get("new_data") or event.get("old_data") or {}
-
-            # Basic implementation - check if all filter conditions match
-            # For more complex filtering, this could be expanded
-            for key, value in trigger.filter_condition.items():
-                if key not in data or data[key] != value:
-                    return False
+            # Use the matcher attached at cache-load time; look it up
+            # for triggers that arrived by another path
+            matcher = getattr(trigger, "_matcher", None)
+            if matcher is None:
+                matcher = self._matcher_for(trigger)
+                trigger._matcher = matcher
 
-            return True
+            # Get the data to check against the filter
+            data = event.new_data or event.old_data or {}
+            return matcher(data)
         except Exception as e:
             logger.error("Error checking filter condition: %s", str(e))
             return False  # Fail safe - don't match if we can't evaluate
 
-    async def _process_trigger(self, trigger: Trigger, event: Dict[str, Any]):
-        """
-        Process a trigger for a matching event.
-
-        Args:
-            trigger: The matching trigger
-            event: The change event to process
-        """
-        db = self._get_db()
-        try:
-            # Create an event record
-            entity_id = self._get_entity_id(event)
-            trigger_event = TriggerEvent(
-                trigger_id=trigger.id,
-                entity_id=entity_id,
-                change_type=event["change_type"],
-                old_data=event.get("old_data"),
-                new_data=event.get("new_data"),
-                processed=False,
-            )
-
-            db.add(trigger_event)
-            db.commit()
-            db.refresh(trigger_event)
-
-            # Send notification to the endpoint
-            response_status = await self._send_notification(
-                trigger, trigger_event, event
-            )
-
-            # Update the event record with the response status
-            update_data = TriggerEventUpdate(
-                processed=True,
-                response_status=response_status,
-                processed_at=datetime.now(UTC),
-            )
-
-            for key, value in update_data.model_dump(exclude_unset=True).items():
-                setattr(trigger_event, key, value)
-
-            db.commit()
-
-        except Exception as e:
-            db.rollback()
-            logger.error("Error processing trigger %s: %s", trigger.id, str(e))
-        finally:
-            db.close()
-
-    def _get_entity_id(self, event: Dict[str, Any]) -> int:
+    def _get_entity_id(self, event: CDCEvent) -> int:
         """
         Extract the entity ID from the event data.
 
@@ -199,7 +455,7 @@ class EventProcessor:
             The entity ID
         """
         # First try to get ID from new_data, then from old_data
-        data = event.get("new_data") or event.get("old_data") or {}
+        data = event.new_data or event.old_data or {}
 
         # Look for 'id' field
         entity_id = data.get("id")
@@ -209,36 +465,63 @@ class EventProcessor:
         # If no ID found, raise an error
         raise ValueError(f"Could not determine entity ID from event data: {data}")
 
-    async def _send_notification(
-        self, trigger: Trigger, trigger_event: TriggerEvent, event: Dict[str, Any]
-    ) -> int:
+    def _build_payload(
+        self,
+        trigger: Trigger,
+        row: dict,
+        created_at: Optional[datetime],
+        event: CDCEvent,
+    ) -> dict:
         """
-        Send a notification to the trigger's endpoint.
+        Build a notification payload for a trigger event.
+
+        The payload is a plain dict; the fields come from our own CDC
+        stream, so there is nothing for Pydantic to validate on this
+        outbound-only path. DatabaseChangeNotification in
+        app.schemas.trigger remains the shape contract.
 
         Args:
             trigger: The trigger being processed
-            trigger_event: The trigger event record
+            row: The inserted trigger-event row values
+            created_at: When the trigger event was recorded
             event: The original change event
 
+        Returns:
+            The notification payload
+        """
+        return {
+            "trigger_name": trigger.name,
+            "entity_type": event.entity_type.value,
+            "entity_id": row["entity_id"],
+            "change_type": event.change_type.value,
+            "old_data": row["old_data"],
+            "new_data": row["new_data"],
+            "timestamp": created_at or datetime.now(UTC),
+        }
+
+    async def _send_notification(self, endpoint: str, payloads: List[dict]) -> int:
+        """
+        Send notification payloads to an endpoint in one POST.
+
+        A single payload is sent as a JSON object (the historical
+        contract); several payloads for the same endpoint are sent
+        together as a JSON array.
+
+        Args:
+            endpoint: Endpoint URL to notify
+            payloads: Notification payloads for this endpoint
+
         Returns:
             HTTP status code from the notification endpoint
         """
         try:
-            # Prepare the notification payload
-            notification = DatabaseChangeNotification(
-                trigger_name=trigger.name,
-                entity_type=event["entity_type"],
-                entity_id=trigger_event.entity_id,
-                change_type=event["change_type"],
-                old_data=event.get("old_data"),
-                new_data=event.get("new_data"),
-                timestamp=trigger_event.created_at,
-            )
+            body = payloads[0] if len(payloads) == 1 else payloads
 
-            # Send the notification to the endpoint
+            # Encoding once and passing bytes skips httpx's stdlib json
+            # encoder
             response = await self.client.post(
-                trigger.endpoint,
-                json=notification.model_dump(),
+                endpoint,
+                content=json_dumps_bytes(body),
                 headers={"Content-Type": "application/json"},
             )
 
@@ -246,33 +529,73 @@ class EventProcessor:
 
             if 200 <= status_code < 300:
                 logger.info(
-                    "Successfully sent notification for trigger %s: %s",
-                    trigger.id,
+                    "Successfully sent %d notification(s) to %s: %s",
+                    len(payloads),
+                    endpoint,
                     status_code,
                 )
             else:
                 logger.warning(
-                    "Failed to send notification for trigger %s: %s",
-                    trigger.id,
+                    "Failed to send %d notification(s) to %s: %s",
+                    len(payloads),
+                    endpoint,
                     status_code,
                 )
 
             return status_code
 
         except httpx.HTTPError as e:
-            logger.error(
-                "HTTP error sending notification for trigger %s: %s", trigger.id, str(e)
-            )
+            logger.error("HTTP error sending notification to %s: %s", endpoint, str(e))
             return 500  # Internal server error
 
         except Exception as e:
-            logger.error(
-                "Error sending notification for trigger %s: %s", trigger.id, str(e)
-            )
+            logger.error("Error sending notification to %s: %s", endpoint, str(e))
             return 500  # Internal server error
 
+    async def _shutdown_async(self):
+        """
+        Drain the queue, stop the workers, and close the HTTP client.
+
+        Must run on the loop that owns the queue and workers.
+        """
+        if self._notify_queue is not None:
+            await self._notify_queue.join()
+            for worker in self._notify_workers:
+                worker.cancel()
+            self._notify_workers = []
+            self._notify_queue = None
+            self._notify_loop = None
+        await self.client.aclose()
+
+    def shutdown(self, timeout: float = 30.0):
+        """
+        Drain and stop the notification workers from any thread.
+
+        Submits the shutdown to the loop that owns the queue and blocks
+        until it completes; a no-op when the workers never started or
+        their loop is already gone.
+
+        Args:
+            timeout: Seconds to wait for queued batches to drain
+        """
+        loop = self._notify_loop
+        if loop is None or not loop.is_running():
+            return
+        future = asyncio.run_coroutine_threadsafe(self._shutdown_async(), loop)
+        future.result(timeout=timeout)
+
     async def close(self):
         """
         Close resources used by the event processor.
+
+        Waits for queued notification batches to drain before stopping
+        the workers and closing the HTTP client. The queue and workers
+        belong to the loop that created them (the CDC listener's
+        persistent loop in production), so when called from a different
+        loop the drain is delegated to the owning one.
         """
-        await self.client.aclose()
+        loop = self._notify_loop
+        if loop is not None and loop is not asyncio.get_running_loop():
+            await asyncio.to_thread(self.shutdown)
+            return
+        await self._shutdown_async()
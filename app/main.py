@@ -4,12 +4,14 @@ Main application module.
 This module sets up the FastAPI application.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.dependencies import request_cache
 from app.api.v1.api import api_router
 from app.cdc.listener import CDCListener
 from app.core.config import settings
@@ -24,36 +26,41 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# Event processor instance to be shared
-event_processor = EventProcessor()
-
-# CDC listener instance to be started/stopped with the application
-cdc_listener = CDCListener(event_processor)
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifespan handler.
 
     This function handles startup and shutdown events for the application.
+    The event processor and CDC listener are constructed here rather than
+    at module scope, so importing the app never opens connections, and the
+    listener is started in a background task: replication-slot setup does
+    blocking connection work that should not delay HTTP readiness.
     """
     import os
 
+    start_task = None
+
     # Startup - but only if not in testing mode
     if os.environ.get("TESTING") != "true":
+        app.state.event_processor = EventProcessor()
+        app.state.cdc_listener = CDCListener(app.state.event_processor)
         logger.info("Starting CDC listener")
-        cdc_listener.start()
+        start_task = asyncio.create_task(
+            asyncio.to_thread(app.state.cdc_listener.start)
+        )
 
     yield
 
     # Shutdown - but only if not in testing mode
-    if os.environ.get("TESTING") != "true":
+    if start_task is not None:
+        if not start_task.done():
+            start_task.cancel()
         logger.info("Stopping CDC listener")
-        cdc_listener.stop()
+        await asyncio.to_thread(app.state.cdc_listener.stop)
 
         # Close HTTP client for event processor
-        await event_processor.close()
+        await app.state.event_processor.close()
 
 
 # Initialize FastAPI app
@@ -72,6 +79,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def request_cache_middleware(request, call_next):
+    """
+    Give each request a fresh memoization store.
+
+    Handlers and dependencies use this to collapse duplicate lookups of the
+    same row into a single query per request.
+    """
+    token = request_cache.set({})
+    try:
+        return await call_next(request)
+    finally:
+        request_cache.reset(token)
+
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -7,23 +7,31 @@ This module defines SQLAlchemy ORM models for triggers and related entities.
 import enum
 import os
 from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import (
     JSON,
     Boolean,
-    Column,
     DateTime,
-    Enum,
     ForeignKey,
-    Integer,
+    Index,
     String,
+    func,
+    text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.models.base import Base, JSONType
 
-# Use custom JSON type for SQLite compatibility in tests
-JSON_COLUMN_TYPE = JSONType if os.environ.get("TESTING") == "true" else JSON
+# Use custom JSON type for SQLite compatibility in tests; production
+# stores JSONB on PostgreSQL (parsed binary form, no re-parse on read,
+# GIN-indexable) via the dialect variant
+JSON_COLUMN_TYPE = (
+    JSONType
+    if os.environ.get("TESTING") == "true"
+    else JSON().with_variant(JSONB(), "postgresql")
+)
 
 
 class ChangeType(str, enum.Enum):
@@ -74,29 +82,46 @@ class Trigger(Base):  # pylint: disable=too-few-public-methods
     """
 
     __tablename__ = "triggers"
+    __table_args__ = (
+        # Serves the CDC matching query (active triggers for an entity
+        # type); change-type matching happens in Python on the result
+        Index("ix_triggers_entity_type_active", "entity_type", "is_active"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, unique=True, nullable=False)
-    entity_type = Column(Enum(EntityType), nullable=False)
-    change_types = Column(
-        JSON_COLUMN_TYPE, nullable=False
-    )  # JSON array of ChangeType values
-    filter_condition = Column(
-        JSON_COLUMN_TYPE, nullable=True
-    )  # Optional JSON condition
-    endpoint = Column(String, nullable=False)
-    is_active = Column(Boolean, default=True)
-    created_at = Column(
-        DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String, unique=True)
+    # Plain string column rather than a native enum: no ALTER TYPE
+    # migrations when values change and no per-row enum adaptation in
+    # the driver; values are validated Python-side below
+    entity_type: Mapped[str] = mapped_column(String(32))
+    # JSON array of ChangeType values
+    change_types: Mapped[List[Any]] = mapped_column(JSON_COLUMN_TYPE)
+    # Optional JSON condition
+    filter_condition: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON_COLUMN_TYPE)
+    endpoint: Mapped[str] = mapped_column(String)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=True)
+    # Server-side defaults: the database stamps rows itself, so bulk
+    # inserts skip one datetime.now() call per row
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
     )
-    updated_at = Column(
+    updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
         onupdate=lambda: datetime.now(UTC),
-        nullable=False,
     )
 
-    events = relationship("TriggerEvent", back_populates="trigger")
+    # No endpoint serializes a trigger's events inline, so any lazy load
+    # here would be an accidental N+1; raise instead, and opt in with
+    # selectinload() where a query genuinely needs the collection
+    events: Mapped[List["TriggerEvent"]] = relationship(
+        back_populates="trigger", lazy="raise"
+    )
+
+    @validates("entity_type")
+    def _validate_entity_type(self, _key: str, value):
+        """Coerce assigned values to a valid EntityType string."""
+        return EntityType(value).value
 
 
 class TriggerEvent(Base):  # pylint: disable=too-few-public-methods
@@ -118,18 +143,34 @@ class TriggerEvent(Base):  # pylint: disable=too-few-public-methods
     """
 
     __tablename__ = "trigger_events"
+    __table_args__ = (
+        # Serves per-trigger "still unprocessed" lookups; partial on
+        # PostgreSQL so processed rows drop out of the index entirely
+        Index(
+            "ix_trigger_events_unprocessed",
+            "trigger_id",
+            "processed",
+            postgresql_where=text("processed = false"),
+            sqlite_where=text("processed = 0"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    trigger_id = Column(Integer, ForeignKey("triggers.id"))
-    entity_id = Column(Integer, nullable=False)
-    change_type = Column(Enum(ChangeType), nullable=False)
-    old_data = Column(JSON_COLUMN_TYPE, nullable=True)
-    new_data = Column(JSON_COLUMN_TYPE, nullable=True)
-    processed = Column(Boolean, default=False)
-    response_status = Column(Integer, nullable=True)
-    created_at = Column(
-        DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    trigger_id: Mapped[Optional[int]] = mapped_column(ForeignKey("triggers.id"))
+    entity_id: Mapped[int]
+    change_type: Mapped[str] = mapped_column(String(32))
+    old_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON_COLUMN_TYPE)
+    new_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON_COLUMN_TYPE)
+    processed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=True)
+    response_status: Mapped[Optional[int]]
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
     )
-    processed_at = Column(DateTime(timezone=True), nullable=True)
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    trigger: Mapped[Optional["Trigger"]] = relationship(back_populates="events")
 
-    trigger = relationship("Trigger", back_populates="events")
+    @validates("change_type")
+    def _validate_change_type(self, _key: str, value):
+        """Coerce assigned values to a valid ChangeType string."""
+        return ChangeType(value).value
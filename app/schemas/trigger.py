@@ -7,7 +7,7 @@ This module defines Pydantic schemas for API request and response validation.
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from app.models.trigger import ChangeType, EntityType
 
@@ -51,12 +51,16 @@ class TriggerInDB(TriggerBase):
     Schema for a trigger as stored in the database.
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+
+# Module-level adapter so list responses validate in one call instead
+# of once per row
+TriggerInDBList = TypeAdapter(List[TriggerInDB])
 
 
 class TriggerEventBase(BaseModel):
@@ -93,6 +97,8 @@ class TriggerEventInDB(TriggerEventBase):
     Schema for a trigger event as stored in the database.
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     trigger_id: int
     processed: bool
@@ -100,8 +106,17 @@ class TriggerEventInDB(TriggerEventBase):
     created_at: datetime
     processed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+
+class TriggerEventPage(BaseModel):
+    """
+    Page of trigger events with a has-more indicator.
+
+    The indicator is derived by fetching one row past the page size, so no
+    COUNT(*) is ever issued against the events table.
+    """
+
+    items: List[TriggerEventInDB]
+    has_more: bool
 
 
 class DatabaseChangeNotification(BaseModel):
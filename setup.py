@@ -10,11 +10,13 @@ setup(
         "pydantic>=2.6.0",
         "pydantic-settings>=2.1.0",
         "sqlalchemy>=2.0.0",
-        "psycopg2-binary>=2.9.9",
+        "asyncpg>=0.29.0",
         "alembic>=1.13.0",
         "psycopg>=3.2.0",
         "psycopg-pool>=3.2.0",
         "httpx>=0.24.0",
+        "msgspec>=0.18.0",
+        "orjson>=3.9.0",
         "python-dotenv>=1.0.0",
         "loguru>=0.7.0",
         "pyyaml>=6.0.0",
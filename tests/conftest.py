@@ -9,51 +9,80 @@ import os
 
 os.environ["TESTING"] = "true"
 
-import sys
-from unittest import mock
+import tempfile
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
-# Mock CDC modules to prevent database connections during tests
-sys.modules["psycopg"] = mock.MagicMock()
-sys.modules["psycopg.rows"] = mock.MagicMock()
-sys.modules["psycopg.sql"] = mock.MagicMock()
-sys.modules["psycopg_pool"] = mock.MagicMock()
-
-# Create and apply module mocks
-event_processor_module = mock.MagicMock()
-mock_event_processor = mock.MagicMock()
-event_processor_class = mock.MagicMock(return_value=mock_event_processor)
-event_processor_module.EventProcessor = event_processor_class
-
-cdc_listener_module = mock.MagicMock()
-mock_cdc_listener = mock.MagicMock()
-cdc_listener_class = mock.MagicMock(return_value=mock_cdc_listener)
-cdc_listener_module.CDCListener = cdc_listener_class
-
-# Apply mocks to modules
-sys.modules["app.events.processor"] = event_processor_module
-sys.modules["app.cdc.listener"] = cdc_listener_module
-
-# Import app dependencies after setting test mode and mocking
+# Import app dependencies after setting test mode
 from app.api.dependencies import get_db  # noqa: E402
 from app.main import app  # noqa: E402
 from app.models.base import Base  # noqa: E402
 
-# Create in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# No module mocks needed: in TESTING mode the lifespan never constructs
+# the CDC listener, and the psycopg import only happens when a listener
+# actually starts
+
+
+# Use a file-backed SQLite database so the sync fixture session and the
+# app's async session see the same data
+TEST_DB_PATH = os.path.join(tempfile.gettempdir(), f"trigger_test_{os.getpid()}.db")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{TEST_DB_PATH}"
+ASYNC_SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///{TEST_DB_PATH}"
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncTestingSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
 
 # Create all tables before tests run
 Base.metadata.create_all(bind=engine)
 
 
+def bulk_create_triggers(db, rows):
+    """
+    Insert trigger rows with one executemany statement.
+
+    Much cheaper than per-object add()/commit()/refresh() as fixture
+    data grows: one INSERT round trip and no ORM identity bookkeeping.
+
+    Args:
+        db: Database session
+        rows: Column-value dicts, one per trigger
+
+    Returns:
+        List of inserted trigger IDs, in input order
+    """
+    from sqlalchemy import insert
+
+    from app.models.trigger import Trigger
+
+    result = db.execute(
+        insert(Trigger).returning(Trigger.id, sort_by_parameter_order=True), rows
+    )
+    ids = [row.id for row in result]
+    db.commit()
+    return ids
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Remove the temporary test database once the suite has finished.
+    """
+    engine.dispose()
+    if os.path.exists(TEST_DB_PATH):
+        os.remove(TEST_DB_PATH)
+
+
 @pytest.fixture()
 def db():
     """
@@ -62,17 +91,16 @@ def db():
     Yields:
         SQLAlchemy session
     """
-    connection = engine.connect()
-    transaction = connection.begin()
-
-    session = TestingSessionLocal(bind=connection)
+    session = TestingSessionLocal()
 
     try:
         yield session
     finally:
         session.close()
-        transaction.rollback()
-        connection.close()
+        # Wipe all rows so each test starts from an empty database
+        with engine.begin() as connection:
+            for table in reversed(Base.metadata.sorted_tables):
+                connection.execute(table.delete())
 
 
 @pytest.fixture()
@@ -87,12 +115,17 @@ def client(db):
         FastAPI TestClient
     """
 
-    # Override the get_db dependency to use test db
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
+    # Clear response caches so earlier tests can't leak stale entries
+    from app.api.v1.endpoints.events import event_cache
+    from app.api.v1.endpoints.triggers import trigger_cache
+
+    trigger_cache.clear()
+    event_cache.clear()
+
+    # Override the get_db dependency to use the test database
+    async def override_get_db():
+        async with AsyncTestingSessionLocal() as session:
+            yield session
 
     app.dependency_overrides[get_db] = override_get_db
 
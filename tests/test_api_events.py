@@ -0,0 +1,151 @@
+"""
+Tests for the events endpoints.
+
+This module contains tests for the trigger events API endpoints.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.trigger import ChangeType, EntityType, Trigger, TriggerEvent
+
+
+def _create_trigger_with_events(db: Session, event_count: int) -> Trigger:
+    """
+    Create a trigger with a series of events spaced one minute apart.
+
+    Args:
+        db: Database session
+        event_count: Number of events to create
+
+    Returns:
+        The created trigger
+    """
+    trigger = Trigger(
+        name="Event Test Trigger",
+        entity_type=EntityType.MONITOR,
+        change_types=["insert"],
+        endpoint="http://localhost:8000/test",
+        is_active=True,
+    )
+    db.add(trigger)
+    db.commit()
+    db.refresh(trigger)
+
+    base_time = datetime.now(UTC)
+    for i in range(event_count):
+        event = TriggerEvent(
+            trigger_id=trigger.id,
+            entity_id=i + 1,
+            change_type=ChangeType.INSERT,
+            new_data={"id": i + 1},
+            processed=False,
+            created_at=base_time + timedelta(minutes=i),
+        )
+        db.add(event)
+    db.commit()
+
+    return trigger
+
+
+def test_read_events_keyset_pagination(client: TestClient, db: Session):
+    """
+    Test paginating events with a keyset cursor.
+
+    Args:
+        client: Test client
+        db: Database session
+    """
+    _create_trigger_with_events(db, 5)
+
+    # First page: newest events first
+    response = client.get("/api/v1/events", params={"limit": 2})
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page["items"]) == 2
+    assert first_page["has_more"] is True
+    assert first_page["items"][0]["entity_id"] == 5
+    assert first_page["items"][1]["entity_id"] == 4
+
+    # Second page: resume from the last event of the first page
+    cursor = first_page["items"][-1]
+    response = client.get(
+        "/api/v1/events",
+        params={
+            "limit": 2,
+            "after_created_at": cursor["created_at"],
+            "after_id": cursor["id"],
+        },
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert len(second_page["items"]) == 2
+    assert second_page["has_more"] is True
+    assert second_page["items"][0]["entity_id"] == 3
+    assert second_page["items"][1]["entity_id"] == 2
+
+
+def test_read_trigger_events_keyset_pagination(client: TestClient, db: Session):
+    """
+    Test paginating a single trigger's events with a keyset cursor.
+
+    Args:
+        client: Test client
+        db: Database session
+    """
+    trigger = _create_trigger_with_events(db, 3)
+
+    response = client.get(f"/api/v1/events/trigger/{trigger.id}", params={"limit": 2})
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page) == 2
+
+    cursor = first_page[-1]
+    response = client.get(
+        f"/api/v1/events/trigger/{trigger.id}",
+        params={
+            "limit": 2,
+            "after_created_at": cursor["created_at"],
+            "after_id": cursor["id"],
+        },
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert len(second_page) == 1
+    assert second_page[0]["entity_id"] == 1
+
+
+def test_read_events_never_counts(client: TestClient, db: Session):
+    """
+    Test that listing events issues no COUNT(*) query.
+
+    Args:
+        client: Test client
+        db: Database session
+    """
+    from conftest import async_engine
+    from sqlalchemy import event as sa_event
+
+    _create_trigger_with_events(db, 3)
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa_event.listen(async_engine.sync_engine, "before_cursor_execute", record_statement)
+    try:
+        response = client.get("/api/v1/events", params={"limit": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) == 2
+        assert data["has_more"] is True
+    finally:
+        sa_event.remove(
+            async_engine.sync_engine, "before_cursor_execute", record_statement
+        )
+
+    assert statements, "expected the listing to query the database"
+    assert not any("count" in stmt.lower() for stmt in statements)
@@ -4,6 +4,7 @@ Tests for the triggers endpoints.
 This module contains tests for the triggers API endpoints.
 """
 
+from conftest import bulk_create_triggers
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
@@ -52,26 +53,28 @@ def test_get_triggers(client: TestClient, db: Session):
         client: Test client
         db: Database session
     """
-    # Create test triggers with lowercase enum values for API compatibility
-    trigger1 = Trigger(
-        name="Test Trigger 1",
-        entity_type=EntityType.MONITOR,
-        change_types=["insert"],  # Use lowercase for API compatibility
-        endpoint="http://localhost:8000/test1",
-        is_active=True,
-    )
-    trigger2 = Trigger(
-        name="Test Trigger 2",
-        entity_type=EntityType.MONITOR_STATUS,
-        change_types=["update", "delete"],  # Use lowercase for API compatibility
-        endpoint="http://localhost:8000/test2",
-        is_active=False,
+    # Seed test triggers in one bulk insert (lowercase enum values for
+    # API compatibility)
+    trigger_ids = bulk_create_triggers(
+        db,
+        [
+            {
+                "name": "Test Trigger 1",
+                "entity_type": "monitor",
+                "change_types": ["insert"],
+                "endpoint": "http://localhost:8000/test1",
+                "is_active": True,
+            },
+            {
+                "name": "Test Trigger 2",
+                "entity_type": "monitor_status",
+                "change_types": ["update", "delete"],
+                "endpoint": "http://localhost:8000/test2",
+                "is_active": False,
+            },
+        ],
     )
 
-    db.add(trigger1)
-    db.add(trigger2)
-    db.commit()
-
     # Test getting all triggers
     response = client.get("/api/v1/triggers")
     assert response.status_code == 200
@@ -79,24 +82,24 @@ def test_get_triggers(client: TestClient, db: Session):
     assert len(data) == 2
 
     # Test getting by ID
-    response = client.get(f"/api/v1/triggers/{trigger1.id}")
+    response = client.get(f"/api/v1/triggers/{trigger_ids[0]}")
     assert response.status_code == 200
     data = response.json()
-    assert data["name"] == trigger1.name
+    assert data["name"] == "Test Trigger 1"
 
     # Test filtering by entity_type (using lowercase to match enum values)
     response = client.get("/api/v1/triggers", params={"entity_type": "monitor_status"})
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 1
-    assert data[0]["name"] == trigger2.name
+    assert data[0]["name"] == "Test Trigger 2"
 
     # Test filtering by is_active
     response = client.get("/api/v1/triggers", params={"is_active": "false"})
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 1
-    assert data[0]["name"] == trigger2.name
+    assert data[0]["name"] == "Test Trigger 2"
 
 
 def test_update_trigger(client: TestClient, db: Session):
@@ -166,3 +169,71 @@ def test_delete_trigger(client: TestClient, db: Session):
     # Verify it's gone
     response = client.get(f"/api/v1/triggers/{trigger.id}")
     assert response.status_code == 404
+
+
+def test_read_triggers_cached(client: TestClient, db: Session):
+    """
+    Test that trigger reads are cached until a write invalidates them.
+
+    Args:
+        client: Test client
+        db: Database session
+    """
+    # Prime the cache with an empty listing
+    response = client.get("/api/v1/triggers")
+    assert response.status_code == 200
+    assert response.json() == []
+
+    # A row added behind the API's back is not visible yet (cached)
+    trigger = Trigger(
+        name="Cached Trigger",
+        entity_type=EntityType.MONITOR,
+        change_types=["insert"],
+        endpoint="http://localhost:8000/cached",
+        is_active=True,
+    )
+    db.add(trigger)
+    db.commit()
+
+    response = client.get("/api/v1/triggers")
+    assert response.status_code == 200
+    assert response.json() == []
+
+    # A write through the API invalidates the cache
+    trigger_data = {
+        "name": "Fresh Trigger",
+        "entity_type": "monitor",
+        "change_types": ["insert"],
+        "endpoint": "http://localhost:8000/fresh",
+        "is_active": True,
+    }
+    response = client.post("/api/v1/triggers", json=trigger_data)
+    assert response.status_code == 201
+
+    response = client.get("/api/v1/triggers")
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+
+def test_create_trigger_duplicate_name(client: TestClient, db: Session):
+    """
+    Test that creating a trigger with a duplicate name fails.
+
+    Args:
+        client: Test client
+        db: Database session
+    """
+    trigger_data = {
+        "name": "Duplicate Trigger",
+        "entity_type": "monitor",
+        "change_types": ["insert"],
+        "endpoint": "http://localhost:8000/test",
+        "is_active": True,
+    }
+
+    response = client.post("/api/v1/triggers", json=trigger_data)
+    assert response.status_code == 201
+
+    response = client.post("/api/v1/triggers", json=trigger_data)
+    assert response.status_code == 400
+    assert "already exists" in response.json()["detail"]
@@ -1,82 +1,229 @@
 """
 Tests for CDC functionality.
 
-This module contains tests for the CDC connection and listener classes.
+This module contains tests for the CDC connection: wal2json format-2
+stream parsing, batching, and the WAL acknowledgment frontier.
 """
 
 import json
+import queue
+import sys
 import unittest.mock as mock
 
+try:
+    import psycopg  # noqa: F401
+except ImportError:
+    # Stub the driver modules just enough to import the CDC code; the
+    # tests below mock all connection behaviour anyway, and exception
+    # classes must be real classes so except clauses stay valid
+    _psycopg_stub = mock.MagicMock()
+    _psycopg_stub.errors.DuplicateObject = type("DuplicateObject", (Exception,), {})
+    sys.modules.setdefault("psycopg", _psycopg_stub)
+    sys.modules.setdefault("psycopg.rows", mock.MagicMock())
+    sys.modules.setdefault("psycopg.sql", mock.MagicMock())
+    sys.modules.setdefault("psycopg_pool", mock.MagicMock())
+
 import pytest
 
 from app.cdc.connection import CDCConnection
+from app.cdc.event import CDCEvent
 from app.models.trigger import ChangeType, EntityType
 
 
-@mock.patch.object(CDCConnection, "_setup_pool")
-@mock.patch.object(CDCConnection, "_create_publication_and_slot")
-def test_cdc_connection_init(mock_create, mock_setup):
+def _connection():
+    """
+    Build a CDCConnection with all database setup mocked out.
+
+    Returns:
+        CDCConnection instance that never touched a database
+    """
+    with mock.patch.object(CDCConnection, "_setup_pool"), mock.patch.object(
+        CDCConnection, "_create_publication_and_slot"
+    ):
+        return CDCConnection(slot_name="test_slot", publication_name="test_publication")
+
+
+def _wal_message(data: dict, lsn: int):
+    """
+    Build a mock replication message carrying a wal2json payload.
+
+    Args:
+        data: Decoded payload the message should carry
+        lsn: WAL position reported for the message
+
+    Returns:
+        Mock with .data and .data_start like a psycopg replication message
+    """
+    message = mock.MagicMock()
+    message.data = json.dumps(data)
+    message.data_start = lsn
+    return message
+
+
+def test_cdc_connection_init():
     """
     Test initializing the CDC connection.
     """
-    connection = CDCConnection(
-        slot_name="test_slot", publication_name="test_publication"
-    )
+    connection = _connection()
 
     assert connection.slot_name == "test_slot"
     assert connection.publication_name == "test_publication"
     assert connection.conn is None
-    assert mock_setup.called
-    assert mock_create.called
 
 
-@pytest.mark.skip(reason="Fix needed for CDC processing test")
-@mock.patch.object(CDCConnection, "_setup_pool")
-@mock.patch.object(CDCConnection, "_create_publication_and_slot")
-def test_cdc_process_change_event(mock_create, mock_setup):
+def test_replication_stream_batches_format2_messages():
     """
-    Test processing a CDC change event.
+    Test that format-2 messages are parsed and handed over as one batch.
     """
-    connection = CDCConnection()
-
-    # Create a mock cursor
-    mock_cursor = mock.MagicMock()
+    connection = _connection()
+    connection._queue = queue.Queue()
 
-    # Sample message data structure
-    message_data = {
-        "change": [
+    messages = [
+        _wal_message({"action": "B"}, 10),
+        _wal_message(
+            {
+                "action": "I",
+                "table": "monitor",
+                "columns": [
+                    {"name": "id", "value": 1},
+                    {"name": "name", "value": "Test Monitor"},
+                    {"name": "status", "value": "active"},
+                ],
+            },
+            11,
+        ),
+        _wal_message(
             {
-                "kind": "insert",
-                "schema": "public",
+                "action": "U",
                 "table": "monitor",
-                "columnnames": ["id", "name", "status"],
-                "columnvalues": [1, "Test Monitor", "active"],
-            }
-        ]
-    }
-
-    # Create a mock message object with data attribute
-    mock_message = mock.MagicMock()
-    mock_message.data = json.dumps(message_data)
-    mock_message.data_start = "0/0"
-
-    # Mock the cursor.read method to return our mock message once, then None
-    mock_cursor.read.side_effect = [mock_message, None]
-
-    # Mock callback function
-    mock_callback = mock.MagicMock()
-
-    # Call the method under test
-    connection._process_replication_stream(mock_cursor, mock_callback)
-
-    # Assertions
-    mock_callback.assert_called_once()
-    call_args = mock_callback.call_args[0][0]
-    assert call_args["entity_type"] == EntityType.MONITOR
-    assert call_args["change_type"] == ChangeType.INSERT
-    assert call_args["old_data"] is None
-    assert call_args["new_data"] == [1, "Test Monitor", "active"]
-    assert call_args["table_name"] == "monitor"
-
-    # Verify cursor.send_feedback was called with the correct LSN
-    mock_cursor.send_feedback.assert_called_once_with(flush_lsn="0/0")
+                "columns": [
+                    {"name": "id", "value": 1},
+                    {"name": "name", "value": "Renamed"},
+                    {"name": "status", "value": "active"},
+                ],
+                "identity": [{"name": "id", "value": 1}],
+            },
+            12,
+        ),
+        _wal_message(
+            {
+                "action": "D",
+                "table": "tags",
+                "identity": [{"name": "id", "value": 7}],
+            },
+            13,
+        ),
+        # Unwatched table and commit marker produce no events
+        _wal_message(
+            {
+                "action": "I",
+                "table": "unwatched",
+                "columns": [{"name": "id", "value": 9}],
+            },
+            14,
+        ),
+        _wal_message({"action": "C"}, 15),
+        # Idle read flushes the pending batch; the error ends the loop
+        None,
+        RuntimeError("stream closed"),
+    ]
+
+    cursor = mock.MagicMock()
+    cursor.read.side_effect = messages
+
+    with pytest.raises(RuntimeError):
+        connection._process_replication_stream(cursor, lambda events: None)
+
+    events, lsn = connection._queue.get_nowait()
+    assert lsn == 15
+    assert [e.change_type for e in events] == [
+        ChangeType.INSERT,
+        ChangeType.UPDATE,
+        ChangeType.DELETE,
+    ]
+
+    insert_event, update_event, delete_event = events
+    assert insert_event.entity_type is EntityType.MONITOR
+    assert insert_event.old_data is None
+    assert insert_event.new_data["name"] == "Test Monitor"
+
+    assert update_event.old_data == {"id": 1}
+    assert update_event.new_data["name"] == "Renamed"
+
+    assert delete_event.entity_type is EntityType.TAG
+    assert delete_event.old_data == {"id": 7}
+    assert delete_event.new_data is None
+
+
+def test_row_schema_rebuilds_on_column_rename():
+    """
+    Test that renaming any column invalidates the cached row schema.
+    """
+    connection = _connection()
+
+    columns = [{"name": n, "value": None} for n in ("id", "name", "status")]
+    names, index = connection._row_schema("monitor", columns)
+    assert names == ("id", "name", "status")
+
+    # Same cached entry comes back while the shape is unchanged
+    assert connection._row_schema("monitor", columns) == (names, index)
+
+    # A renamed middle column must rebuild, not reuse, the schema
+    columns[1]["name"] = "title"
+    renamed, _ = connection._row_schema("monitor", columns)
+    assert renamed == ("id", "title", "status")
+
+
+def test_ack_frontier_only_advances_contiguously():
+    """
+    Test that out-of-order batch completion never acks past in-flight work.
+    """
+    connection = _connection()
+
+    connection._track_batch(10)
+    connection._track_batch(20)
+    connection._track_batch(30)
+
+    # A later batch finishing first must not move the frontier
+    connection._record_batch_done(20)
+    assert connection._processed_lsn is None
+
+    # Completing the earliest batch advances through both
+    connection._record_batch_done(10)
+    assert connection._processed_lsn == 20
+
+    # Idle WAL positions are held back while batches are in flight
+    connection._record_idle_lsn(40)
+    assert connection._processed_lsn == 20
+
+    connection._record_batch_done(30)
+    assert connection._processed_lsn == 30
+
+    connection._record_idle_lsn(40)
+    assert connection._processed_lsn == 40
+
+
+def test_drain_does_not_ack_failed_batches():
+    """
+    Test that a failing callback leaves the batch's WAL unacknowledged.
+    """
+    connection = _connection()
+    connection._queue = queue.Queue()
+    connection._track_batch(5)
+
+    event = CDCEvent(
+        entity_type=EntityType.MONITOR,
+        change_type=ChangeType.INSERT,
+        old_data=None,
+        new_data={"id": 1},
+        table_name="monitor",
+    )
+    connection._queue.put(([event], 5))
+    connection._queue.put(None)  # Stop sentinel
+
+    def failing_callback(events):
+        raise RuntimeError("downstream failure")
+
+    connection._drain(failing_callback)
+
+    assert connection._processed_lsn is None
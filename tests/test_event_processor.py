@@ -0,0 +1,116 @@
+"""
+Tests for the event processor.
+
+This module contains tests for the batch pipeline: trigger matching,
+bulk event storage, and notification delivery with status recording.
+"""
+
+import asyncio
+import unittest.mock as mock
+
+from conftest import TestingSessionLocal
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+import app.events.processor as processor_module
+from app.cdc.event import CDCEvent
+from app.events.processor import EventProcessor
+from app.models.trigger import ChangeType, EntityType, Trigger, TriggerEvent
+
+
+def _insert_event(entity_id: int) -> CDCEvent:
+    """
+    Build an insert change event for a monitor row.
+
+    Args:
+        entity_id: ID of the changed monitor
+
+    Returns:
+        The change event
+    """
+    return CDCEvent(
+        entity_type=EntityType.MONITOR,
+        change_type=ChangeType.INSERT,
+        old_data=None,
+        new_data={"id": entity_id, "name": f"Monitor {entity_id}"},
+        table_name="monitor",
+    )
+
+
+def _run_batch(processor: EventProcessor, events):
+    """
+    Run a batch through the processor and wait for delivery to finish.
+
+    Args:
+        processor: The processor under test
+        events: Change events to process
+    """
+
+    async def run():
+        await processor.process_change_events(events)
+        if processor._notify_queue is not None:
+            await processor._notify_queue.join()
+        await processor.close()
+
+    asyncio.run(run())
+
+
+def test_process_change_events_stores_and_notifies(db: Session, monkeypatch):
+    """
+    Test that a batch is stored, delivered, and marked processed.
+
+    Args:
+        db: Database session
+        monkeypatch: pytest monkeypatch fixture
+    """
+    trigger = Trigger(
+        name="CDC Trigger",
+        entity_type="monitor",
+        change_types=["insert"],
+        endpoint="http://localhost:8000/hook",
+        is_active=True,
+    )
+    db.add(trigger)
+    db.commit()
+
+    monkeypatch.setattr(processor_module, "SessionLocal", TestingSessionLocal)
+
+    processor = EventProcessor()
+    response = mock.MagicMock(status_code=200)
+    processor.client.post = mock.AsyncMock(return_value=response)
+
+    _run_batch(processor, [_insert_event(1), _insert_event(2)])
+
+    rows = db.execute(select(TriggerEvent)).scalars().all()
+    assert len(rows) == 2
+    assert {row.entity_id for row in rows} == {1, 2}
+    for row in rows:
+        assert row.trigger_id == trigger.id
+        assert row.change_type == "insert"
+        assert row.processed is True
+        assert row.response_status == 200
+        assert row.processed_at is not None
+
+    # Both events share the endpoint, so the batch goes out as one POST
+    processor.client.post.assert_awaited_once()
+    call = processor.client.post.await_args
+    assert call.args[0] == "http://localhost:8000/hook"
+
+
+def test_process_change_events_without_matching_triggers(db: Session, monkeypatch):
+    """
+    Test that events matching no trigger store nothing and send nothing.
+
+    Args:
+        db: Database session
+        monkeypatch: pytest monkeypatch fixture
+    """
+    monkeypatch.setattr(processor_module, "SessionLocal", TestingSessionLocal)
+
+    processor = EventProcessor()
+    processor.client.post = mock.AsyncMock()
+
+    _run_batch(processor, [_insert_event(1)])
+
+    assert db.execute(select(TriggerEvent)).scalars().all() == []
+    processor.client.post.assert_not_awaited()